@@ -17,6 +17,9 @@ from torch.utils.data._utils.collate import default_collate
 import numpy as np
 from monai.utils import ensure_tuple_size
 
+# identity matrices of the usual 2D/3D/4D homogeneous affine sizes, copying these is cheaper than calling np.eye
+_IDENTITIES = {n: np.eye(n) for n in (3, 4, 5)}
+
 
 def get_random_patch(dims, patch_size, rand_state=None):
     """
@@ -344,17 +347,23 @@ def to_affine_nd(r, affine):
         r (int or matrix): number of spatial dimensions or an output affine to be filled.
         affine (matrix): 2D affine matrix
     Returns:
-        a (r+1) x (r+1) matrix
+        a (r+1) x (r+1) matrix, its floating point data type is the promotion of the inputs'
+        (at least float32, so float32 inputs are not upcast to float64).
     """
-    affine = np.array(affine, dtype=np.float64)
+    affine = np.asarray(affine)  # read only, no copy needed
     if affine.ndim != 2:
         raise ValueError('input affine must have two dimensions')
-    new_affine = np.array(r, dtype=np.float64, copy=True)
+    new_affine = np.asarray(r)
+    dtype = np.result_type(affine, np.float32) if new_affine.ndim == 0 else \
+        np.result_type(affine, new_affine, np.float32)
     if new_affine.ndim == 0:
         sr = new_affine.astype(int)
         if not np.isfinite(sr) or sr < 0:
             raise ValueError('r must be positive.')
-        new_affine = np.eye(sr + 1, dtype=np.float64)
+        n = int(sr) + 1
+        new_affine = _IDENTITIES[n].astype(dtype) if n in _IDENTITIES else np.eye(n, dtype=dtype)
+    else:
+        new_affine = np.array(new_affine, dtype=dtype, copy=True)  # copied as it is filled in below
     d = max(min(len(new_affine) - 1, len(affine) - 1), 1)
     new_affine[:d, :d] = affine[:d, :d]
     if d > 1:
@@ -15,6 +15,9 @@ defined in :py:class:`monai.transforms.transforms`.
 Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
+import weakref
+from collections import OrderedDict
+
 import numpy as np
 import torch
 
@@ -26,7 +29,8 @@ from monai.transforms.transforms import (AddChannel, AsChannelFirst, Flip, LoadN
                                          ScaleIntensityRange, Spacing, SpatialCrop, Zoom, ToTensor, LoadPNG,
                                          AsChannelLast, ThresholdIntensity, AdjustContrast, CenterSpatialCrop,
                                          CastToType, SpatialPad, RepeatChannel, ShiftIntensity, ScaleIntensity)
-from monai.transforms.utils import (create_grid, generate_pos_neg_label_crop_centers, generate_spatial_bounding_box)
+from monai.transforms.utils import (create_grid, generate_pos_neg_label_crop_centers, generate_spatial_bounding_box,
+                                    map_binary_to_indices)
 from monai.utils.misc import ensure_tuple
 
 
@@ -905,9 +909,18 @@ class RandCropByPosNegLabeld(Randomizable, MapTransform):
             the negative sample(background) center. so the crop center will only exist on valid image area.
         image_threshold (int or float): if enabled image_key, use ``image > image_threshold`` to determine
             the valid image content area.
-    """
-
-    def __init__(self, keys, label_key, size, pos=1, neg=1, num_samples=1, image_key=None, image_threshold=0):
+        cache_indices (bool): whether to keep the foreground/background indices computed for a label (and
+            image) array and reuse them when the same array object is passed again, for example the items
+            cached in memory by a `CacheDataset` with ``num_workers=0``. Entries are matched by object identity,
+            shape and data buffer only, so an array modified in place would get stale indices. Only enable this
+            when the arrays are never edited in place, otherwise pre-compute the indices explicitly with
+            :py:meth:`monai.transforms.utils.map_binary_to_indices`. Defaults to False.
+        cache_size (int): maximum number of cached entries, the least recently used entry is dropped first.
+            each entry holds int64 indices of every spatial voxel, about 8 bytes per voxel. Defaults to 16.
+    """
+
+    def __init__(self, keys, label_key, size, pos=1, neg=1, num_samples=1, image_key=None, image_threshold=0,
+                 cache_indices=False, cache_size=16):
         super().__init__(keys)
         assert isinstance(label_key, str), 'label_key must be a string.'
         assert isinstance(size, (list, tuple)), 'size must be list or tuple.'
@@ -917,17 +930,55 @@ class RandCropByPosNegLabeld(Randomizable, MapTransform):
         assert isinstance(num_samples, int), \
             "invalid samples number: {}. num_samples must be an integer.".format(num_samples)
         assert num_samples >= 0, 'num_samples must be greater than or equal to 0.'
+        assert isinstance(cache_size, int) and cache_size >= 0, 'cache_size must be a non-negative integer.'
         self.label_key = label_key
         self.size = size
         self.pos_ratio = float(pos) / (float(pos) + float(neg))
         self.num_samples = num_samples
         self.image_key = image_key
         self.image_threshold = image_threshold
+        self.cache_indices = cache_indices
+        self.cache_size = cache_size
+        self._indices_cache = OrderedDict()
         self.centers = None
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_indices_cache'] = OrderedDict()  # keyed by object ids, which are only meaningful in this process
+        return state
+
+    def _get_indices(self, label, image):
+        if not self.cache_indices or self.cache_size == 0:
+            return map_binary_to_indices(label, image, self.image_threshold)
+        cache = self._indices_cache
+        key = (id(label), id(image), self.image_threshold)
+        signature = [(a.shape, a.__array_interface__['data']) for a in (label, image) if a is not None]
+        entry = cache.get(key)
+        # the weak references confirm the ids still belong to the same objects
+        if entry is not None and entry[0]() is label and (entry[1] is None or entry[1]() is image) \
+                and entry[2] == signature:
+            cache.move_to_end(key)
+            return entry[3]
+
+        def _drop(ref):  # the label was garbage collected, the entry is only removed if it still owns `ref`
+            if key in cache and cache[key][0] is ref:
+                del cache[key]
+
+        # the references are owned by the entry, so nothing is left registered on the arrays once it is evicted
+        label_ref = weakref.ref(label, _drop)
+        image_ref = weakref.ref(image) if image is not None else None
+        indices = map_binary_to_indices(label, image, self.image_threshold)
+        cache[key] = (label_ref, image_ref, signature, indices)
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return indices
+
     def randomize(self, label, image):
+        fg_indices, bg_indices = self._get_indices(label, image)
         self.centers = generate_pos_neg_label_crop_centers(label, self.size, self.num_samples, self.pos_ratio,
-                                                           image, self.image_threshold, self.R)
+                                                           image, self.image_threshold, self.R,
+                                                           fg_indices=fg_indices, bg_indices=bg_indices)
 
     def __call__(self, data):
         d = dict(data)
@@ -11,6 +11,8 @@
 
 import random
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 
 import numpy as np
 
@@ -24,9 +26,11 @@ def rand_choice(prob=0.5):
 
 def img_bounds(img):
     """Returns the minimum and maximum indices of non-zero lines in axis 0 of `img`, followed by that for axis 1."""
-    ax0 = np.any(img, axis=0)
-    ax1 = np.any(img, axis=1)
-    return np.concatenate((np.where(ax0)[0][[0, -1]], np.where(ax1)[0][[0, -1]]))
+    rows = np.flatnonzero(np.any(img, axis=tuple(i for i in range(img.ndim) if i != 0)))
+    # only the band between the first and last non-zero rows can contain non-zero columns
+    band = img[rows[0]:rows[-1] + 1]
+    cols = np.flatnonzero(np.any(band, axis=tuple(i for i in range(band.ndim) if i != 1)))
+    return np.array([cols[0], cols[-1], rows[0], rows[-1]])
 
 
 def in_bounds(x, y, margin, maxx, maxy):
@@ -41,13 +45,15 @@ def is_empty(img):
 
 def zero_margins(img, margin):
     """Returns True if the values within `margin` indices of the edges of `img` in dimensions 1 and 2 are 0."""
-    if np.any(img[:, :, :margin]) or np.any(img[:, :, -margin:]):
-        return False
-
-    if np.any(img[:, :margin, :]) or np.any(img[:, -margin:, :]):
-        return False
-
-    return True
+    height, width = img.shape[1:3]
+    # the margins in dimension 2 cover the corners so those in dimension 1 only need checking between them
+    margins = (
+        img[:, :, :margin],
+        img[:, :, width - margin:],
+        img[:, :margin, margin:width - margin],
+        img[:, height - margin:, margin:width - margin],
+    )
+    return not any(np.any(m) for m in margins)  # stops at the first margin containing a non-zero value
 
 
 def rescale_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
@@ -61,23 +67,60 @@ def rescale_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
     if mina == maxa:
         return arr * minv
 
-    norm = (arr - mina) / (maxa - mina)  # normalize the array first
-    return (norm * (maxv - minv)) + minv  # rescale by minv and maxv, which is the normalized array by default
+    if dtype is None or not np.issubdtype(arr.dtype, np.floating):
+        norm = (arr - mina) / (maxa - mina)  # normalize first so that the extrema map exactly to 0 and 1
+        return (norm * (maxv - minv)) + minv  # rescale by minv and maxv, which is the normalized array by default
+
+    # `arr` is a private floating point copy from `astype` so normalize and rescale it in place without temporaries
+    np.subtract(arr, mina, out=arr)
+    arr /= maxa - mina
+    arr *= maxv - minv
+    arr += minv
+    return arr
 
 
 def rescale_instance_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
     """Rescale each array slice along the first dimension of `arr` independently."""
-    out = np.zeros(arr.shape, dtype)
-    for i in range(arr.shape[0]):
-        out[i] = rescale_array(arr[i], minv, maxv, dtype)
+    out_dtype = np.dtype(dtype)  # float64 output if dtype is None
+    if dtype is not None:
+        arr = arr.astype(dtype, copy=False)
 
-    return out
+    # per-slice extrema, kept as broadcastable (N, 1, ...) arrays
+    axes = tuple(range(1, arr.ndim))
+    mina = np.min(arr, axis=axes, keepdims=True)
+    maxa = np.max(arr, axis=axes, keepdims=True)
+    constant = mina == maxa
+
+    norm = (arr - mina) / np.where(constant, 1, maxa - mina)  # normalize first so the extrema map exactly to 0 and 1
+    out = norm * (maxv - minv) + minv
+    if np.any(constant):  # constant slices are scaled by minv, as in `rescale_array`
+        np.copyto(out, arr * minv, where=constant)
+
+    return out.astype(out_dtype, copy=False)
 
 
 def rescale_array_int_max(arr, dtype=np.uint16):
     """Rescale the array `arr` to be between the minimum and maximum values of the type `dtype`."""
     info = np.iinfo(dtype)
-    return rescale_array(arr, info.min, info.max).astype(dtype)
+    mina = np.float32(np.min(arr))
+    maxa = np.float32(np.max(arr))
+    if mina == maxa:
+        return rescale_array(arr, info.min, info.max).astype(dtype)
+
+    # rescale slabs of the leading axis as in `rescale_array`, writing straight into the integer output so that
+    # the only floating point temporary is one slab rather than a full-size array, slicing does not copy `arr`
+    out = np.empty(arr.shape, dtype)
+    step = max(1, (1 << 16) // max(1, arr[:1].size))
+    for i in range(0, len(arr), step):
+        norm = arr[i:i + step].astype(np.float32)
+        np.subtract(norm, mina, out=norm)
+        norm /= maxa - mina
+        norm *= info.max - info.min
+        norm += info.min
+        np.clip(norm, info.min, info.max, out=norm)  # guard against rounding past the limits before casting
+        out[i:i + step] = norm
+
+    return out
 
 
 def copypaste_arrays(src, dest, srccenter, destcenter, dims):
@@ -116,15 +159,22 @@ def copypaste_arrays(src, dest, srccenter, destcenter, dims):
     srcslices = [slice(None)] * src.ndim
     destslices = [slice(None)] * dest.ndim
 
-    for i, ss, ds, sc, dc, dim in zip(range(src.ndim), src.shape, dest.shape, srccenter, destcenter, dims):
-        if dim:
-            # dimension before midpoint, clip to size fitting in both arrays
-            d1 = np.clip(dim // 2, 0, min(sc, dc))
-            # dimension after midpoint, clip to size fitting in both arrays
-            d2 = np.clip(dim // 2 + 1, 0, min(ss - sc, ds - dc))
+    # compute the extents for all dimensions at once over small (ndim,) arrays
+    ndim = min(src.ndim, dest.ndim, len(srccenter), len(destcenter), len(dims))
+    ss, ds = np.asarray(src.shape[:ndim]), np.asarray(dest.shape[:ndim])
+    sc, dc = np.asarray(srccenter[:ndim], dtype=int), np.asarray(destcenter[:ndim], dtype=int)
+    dims = np.asarray([dim or 0 for dim in dims[:ndim]], dtype=int)  # 0 or None copies the whole dimension
 
-            srcslices[i] = slice(sc - d1, sc + d2)
-            destslices[i] = slice(dc - d1, dc + d2)
+    # dimension before midpoint, clip to size fitting in both arrays
+    d1 = np.clip(dims // 2, 0, np.minimum(sc, dc))
+    # dimension after midpoint, clip to size fitting in both arrays
+    d2 = np.clip(dims // 2 + 1, 0, np.minimum(ss - sc, ds - dc))
+
+    src_start, src_end = (sc - d1).tolist(), (sc + d2).tolist()
+    dest_start, dest_end = (dc - d1).tolist(), (dc + d2).tolist()
+    for i in np.flatnonzero(dims):
+        srcslices[i] = slice(src_start[i], src_end[i])
+        destslices[i] = slice(dest_start[i], dest_end[i])
 
     return tuple(srcslices), tuple(destslices)
 
@@ -152,15 +202,43 @@ def one_hot(labels, num_classes):
     """
     Converts label image `labels` to a one-hot vector with `num_classes` number of channels as last dimension.
     """
-    labels = labels % num_classes
-    y = np.eye(num_classes)
-    onehot = y[labels.flatten()]
+    flat_labels = (labels % num_classes).astype(np.intp).ravel()
+    onehot = np.zeros((flat_labels.size, num_classes), dtype=labels.dtype)
+    np.put_along_axis(onehot, flat_labels[:, None], 1, axis=1)  # scatter a single write per label
+
+    return onehot.reshape(tuple(labels.shape) + (num_classes,))
 
-    return onehot.reshape(tuple(labels.shape) + (num_classes,)).astype(labels.dtype)
+
+def map_binary_to_indices(label, image=None, image_threshold=0):
+    """
+    Compute the foreground and background indices of the input label, flattened over the spatial dimensions.
+    The result can be computed once per volume and passed to `generate_pos_neg_label_crop_centers` so that
+    repeated sampling does not recompute them.
+
+    Args:
+        label (numpy.ndarray): use the label data to get the foreground/background information, expected input
+            shape: [C, H, W, D] or [C, H, W]. a voxel is foreground if it is non-zero in any channel.
+        image (numpy.ndarray): if image is not None, use ``label = 0 & image > image_threshold``
+            to select background. so the crop center will only exist on valid image area.
+        image_threshold (int or float): if enabled image, use ``image > image_threshold`` to
+            determine the valid image content area.
+
+    Returns:
+        a tuple of 1D arrays (fg_indices, bg_indices) indexing the flattened spatial dimensions of `label`.
+    """
+    label_flat = np.any(label, axis=0).ravel()  # in case label has multiple dimensions
+    fg_indices = np.nonzero(label_flat)[0]
+    if image is not None:
+        img_flat = np.any(image > image_threshold, axis=0).ravel()
+        bg_indices = np.nonzero(np.logical_and(img_flat, ~label_flat))[0]
+    else:
+        bg_indices = np.nonzero(~label_flat)[0]
+
+    return fg_indices, bg_indices
 
 
 def generate_pos_neg_label_crop_centers(label, size, num_samples, pos_ratio, image=None,
-                                        image_threshold=0, rand_state=np.random):
+                                        image_threshold=0, rand_state=np.random, fg_indices=None, bg_indices=None):
     """Generate valid sample locations based on image with option for specifying foreground ratio
     Valid: samples sitting entirely within image, expected input shape: [C, H, W, D] or [C, H, W]
 
@@ -174,6 +252,9 @@ def generate_pos_neg_label_crop_centers(label, size, num_samples, pos_ratio, ima
         image_threshold (int or float): if enabled image_key, use ``image > image_threshold`` to
             determine the valid image content area.
         rand_state (random.RandomState): numpy randomState object to align with other modules.
+        fg_indices (numpy.ndarray): pre-computed foreground indices of `label`, see `map_binary_to_indices`.
+            the indices are computed from `label` and `image` if either this or `bg_indices` is None.
+        bg_indices (numpy.ndarray): pre-computed background indices of `label`, see `map_binary_to_indices`.
     """
     max_size = label.shape[1:]
     assert len(max_size) == len(size), 'expected size does not match label dim.'
@@ -189,13 +270,8 @@ def generate_pos_neg_label_crop_centers(label, size, num_samples, pos_ratio, ima
             valid_end[i] += 1
 
     # Prepare fg/bg indices
-    label_flat = np.any(label, axis=0).ravel()  # in case label has multiple dimensions
-    fg_indices = np.nonzero(label_flat)[0]
-    if image is not None:
-        img_flat = np.any(image > image_threshold, axis=0).ravel()
-        bg_indices = np.nonzero(np.logical_and(img_flat, ~label_flat))[0]
-    else:
-        bg_indices = np.nonzero(~label_flat)[0]
+    if fg_indices is None or bg_indices is None:
+        fg_indices, bg_indices = map_binary_to_indices(label, image, image_threshold)
 
     if not len(fg_indices) or not len(bg_indices):
         if not len(fg_indices) and not len(bg_indices):
@@ -204,24 +280,28 @@ def generate_pos_neg_label_crop_centers(label, size, num_samples, pos_ratio, ima
             len(fg_indices), len(bg_indices)))
         pos_ratio = 0 if not len(fg_indices) else 1
 
-    centers = []
-    for _ in range(num_samples):
+    return _sample_crop_centers(fg_indices, bg_indices, max_size, valid_start, valid_end, pos_ratio, num_samples,
+                                rand_state)
+
+
+def _sample_crop_centers(fg_indices, bg_indices, spatial_shape, valid_start, valid_end, pos_ratio, num_samples,
+                         rand_state):
+    """
+    Draw `num_samples` centers from the flat spatial indices `fg_indices` and `bg_indices`, choosing foreground with
+    probability `pos_ratio`. Each center is unravelled against `spatial_shape` and shifted into the range
+    [`valid_start`, `valid_end`).
+    """
+    # the random numbers are drawn once per sample in this order so that seeded results stay reproducible
+    flat_indices = np.empty(num_samples, dtype=np.intp)
+    for i in range(num_samples):
         indices_to_use = fg_indices if rand_state.rand() < pos_ratio else bg_indices
-        random_int = rand_state.randint(len(indices_to_use))
-        center = np.unravel_index(indices_to_use[random_int], label.shape)
-        center = center[1:]
-        # shift center to range of valid centers
-        center_ori = [c for c in center]
-        for i, c in enumerate(center):
-            center_i = c
-            if c < valid_start[i]:
-                center_i = valid_start[i]
-            if c >= valid_end[i]:
-                center_i = valid_end[i] - 1
-            center_ori[i] = center_i
-        centers.append(center_ori)
-
-    return centers
+        flat_indices[i] = indices_to_use[rand_state.randint(len(indices_to_use))]
+
+    centers = np.stack(np.unravel_index(flat_indices, spatial_shape), axis=1)
+    # shift centers to range of valid centers
+    centers = np.clip(centers, valid_start, np.asarray(valid_end, dtype=np.intp) - 1)
+
+    return centers.tolist()
 
 
 def apply_transform(transform, data):
@@ -252,10 +332,40 @@ def create_grid(spatial_size, spacing=None, homogeneous=True, dtype=float):
     """
     spacing = spacing or tuple(1.0 for _ in spatial_size)
     ranges = [np.linspace(-(d - 1.) / 2. * s, (d - 1.) / 2. * s, int(d)) for d, s in zip(spatial_size, spacing)]
-    coords = np.asarray(np.meshgrid(*ranges, indexing='ij'), dtype=dtype)
-    if not homogeneous:
-        return coords
-    return np.concatenate([coords, np.ones_like(coords[:1])])
+    # broadcast each axis range into its slot of the output, equivalent to np.meshgrid(*ranges, indexing='ij'),
+    # with the homogeneous coordinates allocated up front as the last slot
+    coords = np.empty((len(ranges) + int(homogeneous),) + tuple(len(r) for r in ranges), dtype=dtype)
+    for i, r in enumerate(ranges):
+        coords[i] = r.reshape((-1,) + (1,) * (len(ranges) - i - 1))
+    if homogeneous:
+        coords[-1].fill(1)
+    return coords
+
+
+def create_grids(spatial_sizes, spacings=None, homogeneous=True, dtype=float, num_workers=None):
+    """
+    compute a mesh for each of `spatial_sizes` using `create_grid`, the grids are built concurrently
+    by a pool of threads as numpy releases the GIL while filling them.
+
+    Args:
+        spatial_sizes (sequence of sequences of ints): spatial size of each grid.
+        spacings (sequence of sequences of ints): same len as ``spatial_sizes``, spacing of each grid,
+            defaults to 1.0 for all the grids (dense grids).
+        homogeneous (bool): whether to make homogeneous coordinates.
+        dtype (type): output grid data type.
+        num_workers (int): maximum number of threads, defaults to that of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns:
+        a list of the grids in the order of ``spatial_sizes``.
+    """
+    spacings = spacings or [None] * len(spatial_sizes)
+    if len(spacings) != len(spatial_sizes):
+        raise ValueError('create_grids got {} spatial sizes but {} spacings.'.format(len(spatial_sizes), len(spacings)))
+    # the pool is created per call rather than at module level so that no threads are alive when DataLoader forks
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(create_grid, size, spacing, homogeneous, dtype)
+                   for size, spacing in zip(spatial_sizes, spacings)]
+        return [f.result() for f in futures]
 
 
 def create_control_grid(spatial_shape, spacing, homogeneous=True, dtype=float):
@@ -272,6 +382,27 @@ def create_control_grid(spatial_shape, spacing, homogeneous=True, dtype=float):
     return create_grid(grid_shape, spacing, homogeneous, dtype)
 
 
+def _as_float_tuple(vals):
+    """Returns `vals` as a hashable tuple of floats, to be used as the key of the cached affine constructors."""
+    return tuple(float(v) for v in ensure_tuple(vals))
+
+
+def _readonly_lru_cache(func):
+    """
+    Memoize the affine constructor `func` on its (hashable) arguments. The cached matrices are made read-only so
+    they cannot be modified in place, the public functions return copies of them.
+    """
+
+    @lru_cache(maxsize=1024)
+    @wraps(func)
+    def _cached(*args):
+        affine = func(*args)
+        affine.setflags(write=False)
+        return affine
+
+    return _cached
+
+
 def create_rotate(spatial_dims, radians):
     """
     create a 2D or 3D rotation matrix
@@ -282,39 +413,28 @@ def create_rotate(spatial_dims, radians):
         when spatial_dims == 3, the `radians` sequence corresponds to
         rotation in the 1st, 2nd, and 3rd dim respectively.
     """
-    radians = ensure_tuple(radians)
+    return _create_rotate(spatial_dims, _as_float_tuple(radians)).copy()
+
+
+@_readonly_lru_cache
+def _create_rotate(spatial_dims, radians):
     if spatial_dims == 2:
         if len(radians) >= 1:
             sin_, cos_ = np.sin(radians[0]), np.cos(radians[0])
             return np.array([[cos_, -sin_, 0.], [sin_, cos_, 0.], [0., 0., 1.]])
 
     if spatial_dims == 3:
-        affine = None
         if len(radians) >= 1:
-            sin_, cos_ = np.sin(radians[0]), np.cos(radians[0])
-            affine = np.array([
-                [1., 0., 0., 0.],
-                [0., cos_, -sin_, 0.],
-                [0., sin_, cos_, 0.],
-                [0., 0., 0., 1.],
-            ])
-        if len(radians) >= 2:
-            sin_, cos_ = np.sin(radians[1]), np.cos(radians[1])
-            affine = affine @ np.array([
-                [cos_, 0.0, sin_, 0.],
-                [0., 1., 0., 0.],
-                [-sin_, 0., cos_, 0.],
+            # closed form of the rotations in the 1st, 2nd and 3rd dim composed in that order, missing angles are 0
+            angles = tuple(radians[:3]) + (0.,) * (3 - len(radians[:3]))
+            sin_a, sin_b, sin_c = np.sin(angles)
+            cos_a, cos_b, cos_c = np.cos(angles)
+            return np.array([
+                [cos_b * cos_c, -cos_b * sin_c, sin_b, 0.],
+                [sin_a * sin_b * cos_c + cos_a * sin_c, cos_a * cos_c - sin_a * sin_b * sin_c, -sin_a * cos_b, 0.],
+                [sin_a * sin_c - cos_a * sin_b * cos_c, sin_a * cos_c + cos_a * sin_b * sin_c, cos_a * cos_b, 0.],
                 [0., 0., 0., 1.],
             ])
-        if len(radians) >= 3:
-            sin_, cos_ = np.sin(radians[2]), np.cos(radians[2])
-            affine = affine @ np.array([
-                [cos_, -sin_, 0., 0.],
-                [sin_, cos_, 0., 0.],
-                [0., 0., 1., 0.],
-                [0., 0., 0., 1.],
-            ])
-        return affine
 
     raise ValueError('create_rotate got spatial_dims={}, radians={}.'.format(spatial_dims, radians))
 
@@ -326,7 +446,12 @@ def create_shear(spatial_dims, coefs):
         spatial_dims (int): spatial rank
         coefs (floats): shearing factors, defaults to 0.
     """
-    coefs = list(ensure_tuple(coefs))
+    return _create_shear(spatial_dims, _as_float_tuple(coefs)).copy()
+
+
+@_readonly_lru_cache
+def _create_shear(spatial_dims, coefs):
+    coefs = list(coefs)
     if spatial_dims == 2:
         while len(coefs) < 2:
             coefs.append(0.0)
@@ -354,7 +479,12 @@ def create_scale(spatial_dims, scaling_factor):
         spatial_dims (int): spatial rank
         scaling_factor (floats): scaling factors, defaults to 1.
     """
-    scaling_factor = list(ensure_tuple(scaling_factor))
+    return _create_scale(spatial_dims, _as_float_tuple(scaling_factor)).copy()
+
+
+@_readonly_lru_cache
+def _create_scale(spatial_dims, scaling_factor):
+    scaling_factor = list(scaling_factor)
     while len(scaling_factor) < spatial_dims:
         scaling_factor.append(1.)
     return np.diag(scaling_factor[:spatial_dims] + [1.])
@@ -367,7 +497,11 @@ def create_translate(spatial_dims, shift):
         spatial_dims (int): spatial rank
         shift (floats): translate factors, defaults to 0.
     """
-    shift = ensure_tuple(shift)
+    return _create_translate(spatial_dims, _as_float_tuple(shift)).copy()
+
+
+@_readonly_lru_cache
+def _create_translate(spatial_dims, shift):
     affine = np.eye(spatial_dims + 1)
     for i, a in enumerate(shift[:spatial_dims]):
         affine[i, spatial_dims] = a
@@ -15,6 +15,7 @@ import numpy as np
 
 from monai.transforms import (create_control_grid, create_grid, create_rotate, create_scale, create_shear,
                               create_translate)
+from monai.transforms.utils import create_grids
 
 
 class TestCreateGrid(unittest.TestCase):
@@ -64,6 +65,21 @@ class TestCreateGrid(unittest.TestCase):
                              [[[1., 1.], [1., 1.]], [[1., 1.], [1., 1.]]]])
         np.testing.assert_allclose(g, expected)
 
+    def test_create_grids(self):
+        sizes, spacings = [(1, 1), (2, 2, 2), (3, 4)], [None, (1.2, 1.3, 1.0), (2., 1.)]
+        grids = create_grids(sizes, spacings, num_workers=2)
+        self.assertEqual(len(grids), len(sizes))
+        for g, size, spacing in zip(grids, sizes, spacings):
+            np.testing.assert_allclose(g, create_grid(size, spacing))
+
+        grids = create_grids(sizes[:2], homogeneous=False, dtype=np.float32)
+        for g, size in zip(grids, sizes):
+            self.assertEqual(g.dtype, np.float32)
+            np.testing.assert_allclose(g, create_grid(size, homogeneous=False))
+
+        with self.assertRaisesRegex(ValueError, ''):
+            create_grids(sizes, spacings[:2])
+
     def test_create_control_grid(self):
         with self.assertRaisesRegex(TypeError, ''):
             create_control_grid(None, None)
@@ -171,6 +187,14 @@ class TestCreateAffine(unittest.TestCase):
         test_assert(create_translate, (3, [1, 2, 3, 4, 5]),
                     np.array([[1., 0., 0., 1.], [0., 1., 0., 2.], [0., 0., 1., 3.], [0., 0., 0., 1.]]))
 
+    def test_cached_copy(self):
+        for func, params in ((create_rotate, (3, (1., 2.))), (create_shear, (2, 1.)), (create_scale, (3, 2.)),
+                             (create_translate, (2, [1., 2.]))):
+            m = func(*params)
+            expected = m.copy()
+            m[0, 0] = 100.  # modifying a returned matrix must not affect the cached value
+            test_assert(func, params, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
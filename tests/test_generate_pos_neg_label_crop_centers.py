@@ -30,6 +30,32 @@ TEST_CASE_1 = [
     3
 ]
 
+TEST_CASE_2 = [
+    {
+        'label': np.pad(np.ones([1, 1, 2, 1]), ((0, 0), (0, 4), (0, 3), (3, 0))),
+        'size': [3, 3, 3],
+        'num_samples': 4,
+        'pos_ratio': 1.0,
+        'image': None,
+        'image_threshold': 0,
+        'rand_state': np.random.RandomState()
+    },
+    [1, 1, 2],
+]
+
+TEST_CASE_3 = [  # pre-computed indices take precedence over the label content
+    {
+        'label': np.zeros([1, 5, 5, 4]),
+        'size': [3, 3, 3],
+        'num_samples': 4,
+        'pos_ratio': 1.0,
+        'rand_state': np.random.RandomState(),
+        'fg_indices': np.array([3, 7]),
+        'bg_indices': np.array([0]),
+    },
+    [1, 1, 2],
+]
+
 
 class TestGeneratePosNegLabelCropCenters(unittest.TestCase):
 
@@ -40,6 +66,14 @@ class TestGeneratePosNegLabelCropCenters(unittest.TestCase):
         self.assertEqual(len(result), expected_count)
         self.assertEqual(len(result[0]), expected_shape)
 
+    @parameterized.expand([TEST_CASE_2, TEST_CASE_3])
+    def test_value(self, input_data, expected_center):
+        # the only foreground voxels are at (0, 0, 3) and (0, 1, 3), both are shifted to the same valid center
+        result = generate_pos_neg_label_crop_centers(**input_data)
+        self.assertEqual(len(result), input_data['num_samples'])
+        for center in result:
+            self.assertListEqual(center, expected_center)
+
 
 if __name__ == '__main__':
     unittest.main()
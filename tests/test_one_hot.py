@@ -0,0 +1,40 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms.utils import one_hot
+
+TEST_CASE_1 = [  # 1D labels
+    {'labels': np.array([0, 2, 1]), 'num_classes': 3},
+    np.array([[1, 0, 0], [0, 0, 1], [0, 1, 0]]),
+]
+
+TEST_CASE_2 = [  # 2D labels, values out of range wrap around
+    {'labels': np.array([[0, 1], [2, 3]], dtype=np.uint8), 'num_classes': 2},
+    np.array([[[1, 0], [0, 1]], [[1, 0], [0, 1]]], dtype=np.uint8),
+]
+
+
+class TestOneHot(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_value(self, input_data, expected):
+        result = one_hot(**input_data)
+        self.assertEqual(result.dtype, input_data['labels'].dtype)
+        np.testing.assert_array_equal(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
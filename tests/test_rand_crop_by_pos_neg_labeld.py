@@ -69,6 +69,34 @@ class TestRandCropByPosNegLabeld(unittest.TestCase):
         self.assertTupleEqual(result[0]['extral'].shape, expected_shape)
         self.assertTupleEqual(result[0]['label'].shape, expected_shape)
 
+    def test_cache_indices(self):
+        label = np.zeros([1, 5, 5, 4])
+        label[0, 2, 2, 1] = 1
+        data = {'image': np.random.rand(1, 5, 5, 4), 'label': label}
+        cropper = RandCropByPosNegLabeld(keys=['image', 'label'], label_key='label', size=[3, 3, 3], pos=1, neg=0,
+                                         num_samples=2, cache_indices=True)
+        for _ in range(2):
+            result = cropper(data)
+            self.assertEqual(len(cropper._indices_cache), 1)
+            self.assertEqual(result[0]['label'][0, 1, 1, 1], 1)
+        del data, label, result
+        self.assertEqual(len(cropper._indices_cache), 0)
+
+    def test_cache_size(self):
+        image = np.random.rand(1, 5, 5, 4)
+        cropper = RandCropByPosNegLabeld(keys=['image', 'label'], label_key='label', size=[3, 3, 3],
+                                         image_key='image', cache_indices=True, cache_size=2)
+        labels = [np.random.randint(0, 2, size=[1, 5, 5, 4]) for _ in range(3)]
+        for label in labels:
+            cropper({'image': image, 'label': label})
+        self.assertEqual(len(cropper._indices_cache), 2)  # least recently used entry evicted
+        self.assertNotIn((id(labels[0]), id(image), 0), cropper._indices_cache)
+
+        cropper.image_threshold = 0.5  # a different threshold gives different background indices
+        cropper({'image': image, 'label': labels[2]})
+        self.assertIn((id(labels[2]), id(image), 0.5), cropper._indices_cache)
+        self.assertEqual(len(cropper._indices_cache), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
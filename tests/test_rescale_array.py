@@ -0,0 +1,55 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms.utils import rescale_array
+
+TEST_CASE_1 = [  # out of place, the input is not copied
+    {'arr': np.array([5.3, 6.9, 3.2], np.float32), 'minv': 0., 'maxv': 1., 'dtype': None},
+    np.array([0.5675676, 1., 0.], np.float32),
+]
+
+TEST_CASE_2 = [
+    {'arr': np.array([[-2, 0], [3, 8]]), 'minv': -1., 'maxv': 1., 'dtype': None},
+    np.array([[-1., -0.6], [0., 1.]]),
+]
+
+TEST_CASE_3 = [  # in place on the float32 copy
+    {'arr': np.array([5.3, 6.9, 3.2], np.float32), 'minv': 0., 'maxv': 255., 'dtype': np.float32},
+    np.array([144.72974, 255., 0.], np.float32),
+]
+
+
+class TestRescaleArray(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
+    def test_value(self, input_data, expected):
+        result = rescale_array(**input_data)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+        self.assertEqual(result.min(), input_data['minv'])
+        self.assertEqual(result.max(), input_data['maxv'])
+
+    def test_extrema(self):
+        rand_state = np.random.RandomState(0)
+        for _ in range(200):
+            arr = rand_state.rand(10).astype(np.float32) * 10
+            for dtype in (None, np.float32, np.float64):
+                result = rescale_array(arr, 0., 1., dtype)
+                self.assertEqual(result.min(), 0.)
+                self.assertEqual(result.max(), 1.)
+
+
+if __name__ == '__main__':
+    unittest.main()
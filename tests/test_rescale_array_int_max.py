@@ -0,0 +1,49 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms.utils import rescale_array_int_max
+
+TEST_CASE_1 = [
+    {'arr': np.array([5.3, 6.9, 3.2], np.float32), 'dtype': np.uint8},
+    np.array([144, 255, 0], np.uint8),
+]
+
+TEST_CASE_2 = [  # non-contiguous input
+    {'arr': np.array([[0., 1.], [2., 3.]]).T, 'dtype': np.int16},
+    np.array([[-32768, 10922], [-10923, 32767]], np.int16),
+]
+
+
+class TestRescaleArrayIntMax(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_value(self, input_data, expected):
+        result = rescale_array_int_max(**input_data)
+        self.assertEqual(result.dtype, expected.dtype)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_extrema(self):
+        rand_state = np.random.RandomState(0)
+        for dtype in (np.uint16, np.uint8, np.int16):
+            info = np.iinfo(dtype)
+            for _ in range(200):
+                result = rescale_array_int_max(rand_state.rand(5, 8).astype(np.float32) * 10, dtype)
+                self.assertEqual(result.min(), info.min)
+                self.assertEqual(result.max(), info.max)
+
+
+if __name__ == '__main__':
+    unittest.main()
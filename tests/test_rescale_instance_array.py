@@ -0,0 +1,48 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms.utils import rescale_instance_array
+
+TEST_CASE_1 = [  # the constant second slice is scaled by minv
+    {'arr': np.array([[5.3, 6.9, 3.2], [2., 2., 2.], [0., -4., 4.]], np.float32), 'minv': 1., 'maxv': 3.},
+    np.array([[2.1351352, 3., 1.], [2., 2., 2.], [2., 1., 3.]], np.float32),
+]
+
+TEST_CASE_2 = [
+    {'arr': np.array([[[1, 3], [5, 9]], [[4, 4], [4, 4]]]), 'minv': 0., 'maxv': 1., 'dtype': np.float64},
+    np.array([[[0., 0.25], [0.5, 1.]], [[0., 0.], [0., 0.]]]),
+]
+
+
+class TestRescaleInstanceArray(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
+    def test_value(self, input_data, expected):
+        result = rescale_instance_array(**input_data)
+        self.assertEqual(result.dtype, np.dtype(input_data.get('dtype', np.float32)))
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_extrema(self):
+        rand_state = np.random.RandomState(0)
+        for _ in range(100):
+            arr = rand_state.rand(4, 10).astype(np.float32) * 10
+            result = rescale_instance_array(arr, 0., 1.)
+            np.testing.assert_array_equal(result.min(axis=1), 0.)
+            np.testing.assert_array_equal(result.max(axis=1), 1.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.data.utils import to_affine_nd
+
+AFFINE = [[2, 0, 0, 1], [0, 3, 0, 2], [0, 0, 4, 3], [0, 0, 0, 1]]
+
+TEST_CASE_1 = [  # float32 stays float32
+    {'r': 2, 'affine': np.array(AFFINE, np.float32)},
+    np.array([[2., 0., 1.], [0., 3., 2.], [0., 0., 1.]]),
+    np.float32,
+]
+
+TEST_CASE_2 = [  # int promotes to float64
+    {'r': 2, 'affine': np.array(AFFINE, np.int64)},
+    np.array([[2., 0., 1.], [0., 3., 2.], [0., 0., 1.]]),
+    np.float64,
+]
+
+TEST_CASE_3 = [  # float16 promotes to float32
+    {'r': 3, 'affine': np.array(AFFINE, np.float16)},
+    np.array(AFFINE),
+    np.float32,
+]
+
+TEST_CASE_4 = [  # an output affine is filled without being modified, its dtype takes part in the promotion
+    {'r': np.eye(3, dtype=np.float32), 'affine': np.array(AFFINE, np.float32)},
+    np.array([[2., 0., 1.], [0., 3., 2.], [0., 0., 1.]]),
+    np.float32,
+]
+
+TEST_CASE_5 = [
+    {'r': np.eye(3, dtype=np.float64), 'affine': np.array(AFFINE, np.float32)},
+    np.array([[2., 0., 1.], [0., 3., 2.], [0., 0., 1.]]),
+    np.float64,
+]
+
+
+class TestToAffineND(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4, TEST_CASE_5])
+    def test_value(self, input_data, expected, expected_dtype):
+        r = np.copy(input_data['r'])
+        result = to_affine_nd(**input_data)
+        self.assertEqual(result.dtype, expected_dtype)
+        np.testing.assert_allclose(result, expected)
+        np.testing.assert_array_equal(input_data['r'], r)
+
+    def test_error(self):
+        with self.assertRaisesRegex(ValueError, ''):
+            to_affine_nd(2, np.ones(3))
+        with self.assertRaisesRegex(ValueError, ''):
+            to_affine_nd(-1, np.eye(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
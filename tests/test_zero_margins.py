@@ -0,0 +1,48 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from monai.transforms.utils import zero_margins
+
+
+def _image(*positions):
+    img = np.zeros((2, 6, 7))
+    for p in positions:
+        img[p] = 1
+    return img
+
+
+TEST_CASE_1 = [_image((0, 3, 3)), 2, True]  # non-zero value inside the margins
+
+TEST_CASE_2 = [_image((1, 0, 6)), 1, False]  # corner
+
+TEST_CASE_3 = [_image((0, 5, 3)), 1, False]  # dimension 1 margin, between the corners
+
+TEST_CASE_4 = [_image((0, 1, 3)), 2, False]  # dimension 1 margin, between the corners
+
+TEST_CASE_5 = [_image((0, 3, 1)), 2, False]  # dimension 2 margin
+
+TEST_CASE_6 = [_image((0, 0, 0), (1, 5, 6)), 0, True]  # no margin to check
+
+
+class TestZeroMargins(unittest.TestCase):
+
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4, TEST_CASE_5, TEST_CASE_6])
+    def test_value(self, img, margin, expected):
+        self.assertEqual(zero_margins(img, margin), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()